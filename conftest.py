@@ -0,0 +1,6 @@
+#!/usr/bin/env python3
+
+'''pytest configuration for the repository root.'''
+
+### setup-*.py scripts configure a switch through CPS; they are scripts, not test modules
+collect_ignore_glob = ['setup-*.py']
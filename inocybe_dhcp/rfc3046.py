@@ -16,56 +16,73 @@
 # See the Apache Version 2.0 License for specific language governing
 # permissions and limitations under the License.
 
-from six import (add_metaclass, int2byte, byte2int)
+from types import MappingProxyType
+
+from six import add_metaclass
 
 from .options import (BuiltIn, Option)
 
+def _encode_suboptions(val, subtags, encoding):
+    '''Return a binary string encoding the sub-options in :class:`dict` `val`, in sub-option code
+       order. `subtags` maps sub-option name to code and `encoding` is the encoding of sub-option
+       values. Raise :class:`ValueError` if `val` cannot be encoded.
+    '''
+    octets = bytearray()
+    get = subtags.get
+    for key in sorted(val):
+        tag = get(key)
+        if tag is None:
+            raise ValueError(val)
+        try:
+            value = val[key].encode(encoding)
+        except AttributeError:
+            raise ValueError(val)
+        ### bytearray.append raises ValueError for a value longer than 255 octets
+        octets.append(tag)
+        octets.append(len(value))
+        octets.extend(value)
+    return bytes(octets)
+
+def _decode_suboptions(octets, suboptions, encoding):
+    '''Return a :class:`dict` of sub-options decoded from binary string `octets`. `suboptions` is a
+       sequence of 256 sub-option names indexed by sub-option code, with None for unsupported codes,
+       and `encoding` is the encoding of sub-option values. Raise :class:`ValueError` if `octets`
+       cannot be decoded.
+    '''
+    view = memoryview(octets)
+    end = len(view)
+    if end < 2:
+        raise ValueError(octets)
+    value = {}
+    ### walk `octets` with an offset rather than reslicing it per sub-option
+    offset = 0
+    while offset < end:
+        start = offset + 2
+        if start <= end:
+            stop = start + view[offset + 1]
+            if stop <= end:
+                key = suboptions[view[offset]]
+                if key is not None:
+                    value[key] = view[start:stop].tobytes().decode(encoding)
+                    offset = stop
+                    continue
+        raise ValueError(octets)
+    return value
+
 @add_metaclass(BuiltIn)
 class RelayAgentInformation(Option):
     '''RFC 3046 Section 2.0 Relay Agent Information Option'''
     option = 'Relay Agent Information'
     tag = 82
     value_type = True
-    suboptions = {1: 'circuit-id', 2: 'remote-id'}
-    subtags = {'circuit-id': 1, 'remote-id': 2}
+    suboptions = MappingProxyType({1: 'circuit-id', 2: 'remote-id'})
+    subtags = MappingProxyType({'circuit-id': 1, 'remote-id': 2})
+    ### sub-option names indexed by sub-option code, for decoding without hashing each code
+    _suboption_arr = tuple(map(suboptions.get, range(256)))
     encoding = 'iso-8859-1'
     @classmethod
     def encode_value(cls, val):
-        octets = b''
-        for key in sorted(val):
-            try:
-                tag = cls.subtags[key]
-            except KeyError:
-                raise ValueError(val)
-            else:
-                octets += int2byte(tag)
-            try:
-                value = val[key].encode(cls.encoding)
-            except AttributeError:
-                raise ValueError(val)
-            else:
-                octets += int2byte(len(value))
-                octets += value
-        return octets
+        return _encode_suboptions(val, cls.subtags, cls.encoding)
     @classmethod
     def decode_value(cls, octets):
-        if len(octets) < 2:
-            raise ValueError(octets)
-        value = {}
-        while octets:
-            tag = byte2int(octets)
-            octets = octets[1:]
-            if octets:
-                length = byte2int(octets)
-                octets = octets[1:]
-                if length <= len(octets):
-                    try:
-                        key = cls.suboptions[tag]
-                    except KeyError:
-                        pass
-                    else:
-                        value[key] = octets[:length].decode(cls.encoding)
-                        octets = octets[length:]
-                        continue
-            raise ValueError(octets)
-        return value
+        return _decode_suboptions(octets, cls._suboption_arr, cls.encoding)
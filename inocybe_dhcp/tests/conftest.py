@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+
+'''pytest configuration for inocybe_dhcp tests.'''
+
+def pytest_generate_tests(metafunc):
+    '''Parametrize test methods of a test class which has a `cases` attribute, a mapping of test
+       method name to a 2-tuple (parameter names, name of the class attribute holding the cases).
+    '''
+    try:
+        (argnames, attr) = metafunc.cls.cases[metafunc.function.__name__]
+    except (AttributeError, KeyError):
+        return
+    metafunc.parametrize(argnames, getattr(metafunc.cls, attr))
+
+def _has_no_cases(item):
+    '''Return True if `item` is a test method parametrized from an empty class attribute.'''
+    try:
+        (_, attr) = item.cls.cases[item.function.__name__]
+    except (AttributeError, KeyError):
+        return False
+    return not getattr(item.cls, attr)
+
+def pytest_collection_modifyitems(config, items):
+    '''Deselect test methods with no cases, rather than report each as skipped.'''
+    deselected = [_ for _ in items if _has_no_cases(_)]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [_ for _ in items if not _has_no_cases(_)]
@@ -2,8 +2,7 @@
 
 '''Test cases for inocybe_dhcp.options.'''
 
-from nose.tools import assert_equal
-from nose.tools import raises
+import pytest
 
 from inocybe_dhcp.options import (Option, Supported, BuiltIn)
 from inocybe_dhcp.types import IPv4
@@ -11,7 +10,9 @@ from inocybe_dhcp.types import IPv4
 ### tests for :class:`Option`
 
 class OptionTest(object):
-    '''Common test procedures for option implementations.'''
+    '''Common test procedures for option implementations. Each test method is parametrized with the
+       cases in the class attribute named by :attr:`cases`, by the hook in conftest.py.
+    '''
     ### the option class under test
     option = None
     ### a sequence of (input, output) values for `encode` call
@@ -22,38 +23,27 @@ class OptionTest(object):
     accepts_decode = ()
     ### a sequence of input values raising KeyError, ValueError or TypeError for `decode` call
     rejects_decode = ()
-    def __init__(self):
-        self.option_name = self.option.__module__ + '.' + self.option.__name__
-    def description(self, fmt, val):
-        '''Format and return `fmt` with :attr:`option_name`, class name of `val` and `val`.'''
-        try:
-            return fmt.format(self.option_name, val.__class__.__name__, val)
-        except UnicodeEncodeError:
-            return fmt.format(self.option_name, val.__class__.__name__, val.encode('utf-8'))
-    def test_accepts_encode(self):
+    ### test method name: (parameter names, name of class attribute with the cases)
+    cases = {
+        'test_accepts_encode': ('in_, out', 'accepts_encode'),
+        'test_rejects_encode': ('in_', 'rejects_encode'),
+        'test_accepts_decode': ('in_, out', 'accepts_decode'),
+        'test_rejects_decode': ('in_', 'rejects_decode'),
+    }
+    def test_accepts_encode(self, in_, out):
         '''Test option accepts values for encode call.'''
-        for (in_, out) in self.accepts_encode:
-            func = lambda p=self.option, i=in_, o=out: assert_equal(p.encode(i), o)
-            func.description = self.description('Test {} accepts encode {} {}', in_)
-            yield func
-    def test_rejects_encode(self):
+        assert self.option.encode(in_) == out
+    def test_rejects_encode(self, in_):
         '''Test option rejects values for encode call.'''
-        for in_ in self.rejects_encode:
-            func = raises(KeyError, ValueError, TypeError)(lambda p=self.option, i=in_: p.encode(i))
-            func.description = self.description('Test {} rejects encode {} {}', in_)
-            yield func
-    def test_accepts_decode(self):
+        with pytest.raises((KeyError, ValueError, TypeError)):
+            self.option.encode(in_)
+    def test_accepts_decode(self, in_, out):
         '''Test option accepts values for decode call.'''
-        for (in_, out) in self.accepts_decode:
-            func = lambda p=self.option, i=in_, o=out: assert_equal(p.decode(i), o)
-            func.description = self.description('Test {} accepts decode {} {}', in_)
-            yield func
-    def test_rejects_decode(self):
+        assert self.option.decode(in_) == out
+    def test_rejects_decode(self, in_):
         '''Test option rejects values for decode call.'''
-        for in_ in self.rejects_decode:
-            func = raises(KeyError, ValueError, TypeError)(lambda p=self.option, i=in_: p.decode(i))
-            func.description = self.description('Test {} rejects decode {} {}', in_)
-            yield func
+        with pytest.raises((KeyError, ValueError, TypeError)):
+            self.option.decode(in_)
 
 class TagOnly(Option):
     '''A tag-only option implementation.'''
@@ -211,103 +201,104 @@ class _MockTlv(_MockOption): ### pylint: disable=too-few-public-methods
             raise ValueError(option)
         return {'option': self.option, 'value': self.val}
 
-@raises(ValueError)
 def test_supported_duplicate_option():
     '''Test inocybe_dhcp.options.Supported rejects duplicate option name'''
     option = _MockOption('duplicate name', None)
     supported = Supported()
     supported.add(option)
-    supported.add(option)
+    with pytest.raises(ValueError):
+        supported.add(option)
 
-@raises(ValueError)
 def test_supported_duplicate_tag():
     '''Test inocybe_dhcp.options.Supported rejects duplicate option tag'''
     supported = Supported()
     supported.add(_MockOption('first', 1))
-    supported.add(_MockOption('second', 1))
+    second = _MockOption('second', 1)
+    with pytest.raises(ValueError):
+        supported.add(second)
 
 def test_supported_encode_empty():
     '''Test inocybe_dhcp.options.Supported encodes empty options sequence'''
     supported = Supported()
-    assert_equal([], supported.encode([]))
+    assert [] == supported.encode([])
 
 def test_supported_encode_tag():
     '''Test inocybe_dhcp.options.Supported encodes tag options'''
     supported = Supported()
     supported.add(_MockTagOnly('two', 2))
     ### encode of registered option
-    assert_equal([{'tag': 2}], supported.encode([{'option': 'two'}]))
+    assert [{'tag': 2}] == supported.encode([{'option': 'two'}])
     ### encode of unregistered option
-    assert_equal([{'tag': 255}], supported.encode([{'tag': 255}]))
+    assert [{'tag': 255}] == supported.encode([{'tag': 255}])
 
 def test_supported_encode_tlv():
     '''Test inocybe_dhcp.options.Supported encodes tlv options'''
     supported = Supported()
     supported.add(_MockTlv('three', 3, 'foobar', b'\x05\x06\x07\x08'))
     ### encode of registered option with "good" value
-    assert_equal([{
+    assert [{
         'tag': 3, 'length': 4, 'value': b'\x05\x06\x07\x08',
-    }], supported.encode([{
+    }] == supported.encode([{
         'option': 'three', 'value': 'baz',
-    }]))
+    }])
     ### encode of registered option with "bad" value
-    assert_equal([{
+    assert [{
         'option': 'three', 'value': 'foobar',
-    }], supported.encode([{
+    }] == supported.encode([{
         'option': 'three', 'value': 'foobar',
-    }]))
+    }])
     ### encode of unregistered option with arbitrary value
-    assert_equal([{
+    assert [{
         'tag': 4, 'length': 4, 'value': b'\x05\x06\x07\x08',
-    }], supported.encode([{
+    }] == supported.encode([{
         'tag': 4, 'length': 4, 'value': '05:06:07:08',
-    }]))
+    }])
 
 def test_supported_decode_empty():
     '''Test inocybe_dhcp.options.Supported decodes empty options sequence'''
     supported = Supported()
-    assert_equal([], supported.decode([]))
+    assert [] == supported.decode([])
 
 def test_supported_decode_tag():
     '''Test inocybe_dhcp.options.Supported decodes tag options'''
     supported = Supported()
     supported.add(_MockTagOnly('two', 2))
     ### decode of registered option tag
-    assert_equal([{'option': 'two'}], supported.decode([{'tag': 2}]))
+    assert [{'option': 'two'}] == supported.decode([{'tag': 2}])
     ### decode of unregistered option tag
-    assert_equal([{'tag': 255}], supported.decode([{'tag': 255}]))
+    assert [{'tag': 255}] == supported.decode([{'tag': 255}])
 
 def test_supported_decode_tlv():
     '''Test inocybe_dhcp.options.Supported decodes tlv options'''
     supported = Supported()
     supported.add(_MockTlv('three', 3, b'\x00\x01\x02\x03', 'foo'))
     ### decode of registered option tag with "good" value
-    assert_equal([{
+    assert [{
         'option': 'three', 'value': 'foo',
-    }], supported.decode([{
+    }] == supported.decode([{
         'tag': 3, 'length': 4, 'value': b'\x01\x02\x03\x04',
-    }]))
+    }])
     ### decode of registered option tag with "bad" value
-    assert_equal([{
+    assert [{
         'tag': 3, 'length': 4, 'value': '00:01:02:03',
-    }], supported.decode([{
+    }] == supported.decode([{
         'tag': 3, 'length': 4, 'value': b'\x00\x01\x02\x03',
-    }]))
+    }])
     ### decode of unregistered option tag with arbitrary value
-    assert_equal([{
+    assert [{
         'tag': 4, 'length': 4, 'value': '06:07:08:09',
-    }], supported.decode([{
+    }] == supported.decode([{
         'tag': 4, 'length': 4, 'value': b'\x06\x07\x08\x09',
-    }]))
+    }])
 
 ### tests for :class:`BuiltIn`
 
 def test_builtin_encode():
     '''Test inocybe_dhcp.options.BuiltIn encodes options'''
-    assert_equal([{'tag': 0}], BuiltIn.encode([{'option': 'Pad'}]))
-    assert_equal([{'tag': 255}], BuiltIn.encode([{'option': 'End'}]))
+    assert [{'tag': 0}] == BuiltIn.encode([{'option': 'Pad'}])
+    assert [{'tag': 255}] == BuiltIn.encode([{'option': 'End'}])
 
 def test_builtin_decode():
     '''Test inocybe_dhcp.options.BuiltIn decodes options'''
-    assert_equal([{'option': 'Pad'}], BuiltIn.decode([{'tag': 0}]))
-    assert_equal([{'option': 'End'}], BuiltIn.decode([{'tag': 255}]))
+    assert [{'option': 'Pad'}] == BuiltIn.decode([{'tag': 0}])
+    assert [{'option': 'End'}] == BuiltIn.decode([{'tag': 255}])
@@ -3,7 +3,6 @@
 '''Test cases for inocybe_dhcp.rfc2131.'''
 
 import os.path
-from nose.tools import assert_equal
 
 from inocybe_dhcp.rfc2131 import Message as DhcpMessage
 from inocybe_dhcp.options import BuiltIn as DhcpOptions
@@ -67,17 +66,17 @@ def test_message():
     '''Test inocybe_dhcp.rfc2131.Message class'''
     ### pylint: disable=no-member
     unpacked = DhcpMessage.unpack(OCTETS)
-    assert_equal(EXPECTED, unpacked)
+    assert EXPECTED == unpacked
     ### test truncate_chaddr() is a no-op for a good message
     unpacked.truncate_chaddr()
-    assert_equal(EXPECTED, unpacked)
+    assert EXPECTED == unpacked
     ### test pack to octets
     packed = unpacked.pack()
-    assert_equal(OCTETS[:len(packed)], packed)
+    assert OCTETS[:len(packed)] == packed
     ### trailing octets must only be right fill zeroes
-    assert_equal(OCTETS[len(packed):], b'\x00' * (len(OCTETS) - len(packed)))
+    assert OCTETS[len(packed):] == b'\x00' * (len(OCTETS) - len(packed))
     ### final sanity check
-    assert_equal(EXPECTED, unpacked)
+    assert EXPECTED == unpacked
 
 def test_message_decode_options():
     '''Test inocybe_dhcp.rfc2131.Message decode_options()'''
@@ -97,10 +96,10 @@ def test_message_decode_options():
     }, {
         "tag": 255
     }]
-    assert_equal(expected, DhcpMessage.unpack(OCTETS).decode_options())
+    assert expected == DhcpMessage.unpack(OCTETS).decode_options()
     ### test with options chopped, decoding as TLV
     expected['options'] = [{'tag': 255}]
-    assert_equal(expected, DhcpMessage.unpack(OCTETS[:240]).decode_options())
+    assert expected == DhcpMessage.unpack(OCTETS[:240]).decode_options()
 
 def test_message_encode_options():
     '''Test inocybe_dhcp.rfc2131.Message encode_options()'''
@@ -128,25 +127,25 @@ def test_message_encode_options():
     msg.encode_options(options, DhcpOptions, append=True)
     ### pack
     packed = msg.pack()
-    assert_equal(OCTETS[:len(packed)], packed)
-    assert_equal(EXPECTED, DhcpMessage.unpack(packed))
+    assert OCTETS[:len(packed)] == packed
+    assert EXPECTED == DhcpMessage.unpack(packed)
     ### set options as TLV
     options = ({'tag': 255},)
     msg.encode_options(options)
     ### pack
     packed = msg.pack()
-    assert_equal(240 + 1, len(packed))
-    assert_equal(OCTETS[:240] + b'\xFF', packed)
+    assert 240 + 1 == len(packed)
+    assert OCTETS[:240] + b'\xFF' == packed
     expected = dict(EXPECTED)
     expected['options'] = options
-    assert_equal(expected, DhcpMessage.unpack(packed))
+    assert expected == DhcpMessage.unpack(packed)
 
 def test_truncate_chaddr_benign():
     '''Test inocybe_dhcp.rfc2131.Message truncate_chaddr() is benign'''
     msg = DhcpMessage()
-    assert_equal({}, msg)
+    assert {} == msg
     msg.truncate_chaddr()
-    assert_equal({}, msg)
+    assert {} == msg
 
 def test_truncate_chaddr_success():
     '''Test inocybe_dhcp.rfc2131.Message truncate_chaddr() truncates chaddr'''
@@ -155,13 +154,13 @@ def test_truncate_chaddr_success():
         'hlen': 16,
         'chaddr': '00:11:22:33:44:55:66:77:88:99:AA:BB:CC:DD:EE:FF',
     })
-    assert_equal({
+    assert {
         'hlen': 16,
         'chaddr': '00:11:22:33:44:55:66:77:88:99:AA:BB:CC:DD:EE:FF',
-    }, msg)
+    } == msg
     msg['hlen'] = 6
     msg.truncate_chaddr()
-    assert_equal({
+    assert {
         'hlen': 6,
         'chaddr': '00:11:22:33:44:55',
-    }, msg)
+    } == msg
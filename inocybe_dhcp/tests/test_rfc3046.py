@@ -33,6 +33,8 @@ class TestRelayAgentInformation(OptionTest):
         {'option': 'Relay Agent Information', 'value': {'foo': 'bar'}},
         ### bad sub-option value
         {'option': 'Relay Agent Information', 'value': {'circuit-id': (1, 2, 3)}},
+        ### sub-option value too long
+        {'option': 'Relay Agent Information', 'value': {'circuit-id': 'X' * 256}},
     )
     accepts_decode = (
         ({'tag': 82, 'length': 3, 'value': b'\x01\x01\x58'},
@@ -3,10 +3,7 @@
 
 '''Test cases for inocybe_dhcp.tlv.'''
 
-from nose.tools import assert_equal
-from nose.tools import raises
-
-from six import add_metaclass
+import pytest
 
 from inocybe_dhcp.tlv import (
     Int,
@@ -17,10 +14,46 @@ from inocybe_dhcp.tlv import (
     Value,
 )
 
+### values of the wrong type for each kind of value type, which it must reject
+_NON_INT_INPUTS = (
+    None,
+    'foo',
+    (), (1, 2),
+    [], [1, 2],
+    {}, {1: 2},
+)
+_NON_IP_INPUTS = (
+    None,
+    False, True,
+    -1, 0, 1,
+    -2.3, 0.1, 4.8,
+    (), ('1.2.3.4',),
+    [], ['0.0.0.0',],
+    {}, {'255.255.255.255': '0.0.0.0'},
+)
+_NON_STR_INPUTS = (
+    None,
+    False, True,
+    -1, 0, 1,
+    -2.3, 0.1, 4.8,
+    (), ('baz',),
+    [], ['baz',],
+    {}, {'baz': 'quux'},
+)
+_NON_HEX_INPUTS = (
+    None,
+    False, True,
+    -1, 0, 1,
+    -2.3, 0.1, 4.8,
+    (), ('AB',),
+    [], ['AB',],
+    {}, {'AB': 'CD'},
+)
+
 class _TestValueType(object):
-    '''Common test procedures for a value type.'''
-    ### a custom type name to present in test case descriptions (default=class name of value type)
-    type_name = None
+    '''Common test procedures for a value type. Each test method is parametrized with the cases in
+       the class attribute named by :attr:`cases`, by the hook in conftest.py.
+    '''
     ### the value type instance under test
     value_type = None
     ### a sequence of (attribute name, expected value) which `value_type` must have
@@ -39,65 +72,52 @@ class _TestValueType(object):
     accepts_decode = ()
     ### a sequence of input values raising ValueError or TypeError for `value_type` decode call
     rejects_decode = ()
-    def __init__(self):
-        if self.type_name is None:
-            self.type_name = self.value_type.__class__.__name__
-    def description(self, fmt, val):
-        '''Format and return `fmt` with :attr:`type_name`, class name of `val` and `val`.'''
-        try:
-            return fmt.format(self.type_name, val.__class__.__name__, val)
-        except UnicodeEncodeError:
-            return fmt.format(self.type_name, val.__class__.__name__, val.encode('utf-8'))
-    def test_attrs(self):
+    ### test method name: (parameter names, name of class attribute with the cases)
+    cases = {
+        'test_attrs': ('attr, val', 'attrs'),
+        'test_accepts_value': ('in_, out', 'accepts_value'),
+        'test_rejects_value': ('in_', 'rejects_value'),
+        'test_accepts_encode': ('in_, out', 'accepts_encode'),
+        'test_rejects_encode': ('in_', 'rejects_encode'),
+        'test_accepts_decode': ('in_, out', 'accepts_decode'),
+        'test_rejects_decode': ('in_', 'rejects_decode'),
+    }
+    @pytest.fixture(autouse=True)
+    def value_type_unchanged(self):
+        '''Fail any test which changes the state of :attr:`value_type`, which all tests share.'''
+        state = dict(vars(self.value_type))
+        yield
+        assert vars(self.value_type) == state
+    def test_attrs(self, attr, val):
         '''Test value type has expected attribute values.'''
-        for (attr, val) in self.attrs:
-            func = lambda t=self.value_type, a=attr, v=val: assert_equal(getattr(t, a), v)
-            func.description = 'Test {} has {} attr value {}'.format(self.type_name, attr, val)
-            yield func
-    def test_accepts_value(self):
+        assert getattr(self.value_type, attr) == val
+    def test_accepts_value(self, in_, out):
         '''Test value type accepts values for direct call.'''
-        for (in_, out) in self.accepts_value:
-            func = lambda t=self.value_type, i=in_, o=out: assert_equal(t(i), o)
-            func.description = self.description('Test {} accepts value {} {}', in_)
-            yield func
-    def test_rejects_value(self):
+        assert self.value_type(in_) == out
+    def test_rejects_value(self, in_):
         '''Test value type rejects values for direct call.'''
-        for in_ in self.rejects_value:
-            func = raises(ValueError, TypeError)(lambda t=self.value_type, i=in_: t(i))
-            func.description = self.description('Test {} rejects value {} {}', in_)
-            yield func
-    def test_accepts_encode(self):
+        with pytest.raises((ValueError, TypeError)):
+            self.value_type(in_)
+    def test_supports_encode(self):
+        '''Test value type has an encode method if, and only if, it accepts values to encode.'''
+        assert hasattr(self.value_type, 'encode') == bool(self.accepts_encode)
+    def test_accepts_encode(self, in_, out):
         '''Test value type accepts values for encode call.'''
-        for (in_, out) in self.accepts_encode:
-            func = lambda t=self.value_type, i=in_, o=out: assert_equal(t.encode(i), o)
-            func.description = self.description('Test {} accepts encode {} {}', in_)
-            yield func
-        if not self.accepts_encode:
-            func = raises(AttributeError)(lambda t=self.value_type: t.encode)
-            func.description = 'Test {} does not support encode'.format(self.type_name)
-            yield func
-    def test_rejects_encode(self):
+        assert self.value_type.encode(in_) == out
+    def test_rejects_encode(self, in_):
         '''Test value type rejects values for encode call.'''
-        for in_ in self.rejects_encode:
-            func = raises(ValueError, TypeError)(lambda t=self.value_type, i=in_: t.encode(i))
-            func.description = self.description('Test {} rejects encode {} {}', in_)
-            yield func
-    def test_accepts_decode(self):
+        with pytest.raises((ValueError, TypeError)):
+            self.value_type.encode(in_)
+    def test_supports_decode(self):
+        '''Test value type has a decode method if, and only if, it accepts values to decode.'''
+        assert hasattr(self.value_type, 'decode') == bool(self.accepts_decode)
+    def test_accepts_decode(self, in_, out):
         '''Test value type accepts values for decode call.'''
-        for (in_, out) in self.accepts_decode:
-            func = lambda t=self.value_type, i=in_, o=out: assert_equal(t.decode(i), o)
-            func.description = self.description('Test {} accepts decode {} {}', in_)
-            yield func
-        if not self.accepts_decode:
-            func = raises(AttributeError)(lambda t=self.value_type: t.decode)
-            func.description = 'Test {} does not support decode'.format(self.type_name)
-            yield func
-    def test_rejects_decode(self):
+        assert self.value_type.decode(in_) == out
+    def test_rejects_decode(self, in_):
         '''Test value type rejects values for decode call.'''
-        for in_ in self.rejects_decode:
-            func = raises(ValueError, TypeError)(lambda t=self.value_type, i=in_: t.decode(i))
-            func.description = self.description('Test {} rejects decode {} {}', in_)
-            yield func
+        with pytest.raises((ValueError, TypeError)):
+            self.value_type.decode(in_)
 
 ### test accepts/rejects integers and stringy integers for all integer classes
 ### test accepts/rejects other native types only for base integer class
@@ -120,14 +140,8 @@ class TestInt(_TestValueType):
     )
     rejects_value = (
         -11, 8, '-12', '0xA',
-    ) + (
-        None,
         -11.2, 8.1,
-        'foo',
-        (), (1, 2),
-        [], [1, 2],
-        {}, {1: 2},
-    )
+    ) + _NON_INT_INPUTS
 
 class TestUInt8(_TestValueType):
     '''Test :class:`UInt8`.'''
@@ -146,20 +160,19 @@ class TestUInt8(_TestValueType):
         -1, 256, '-2', '0x100',
     )
 
-@raises(ValueError)
 def test_uint8_min():
     '''Test UInt8 cannot be restricted with negative min_ value'''
-    UInt8(min_=-1)
+    with pytest.raises(ValueError):
+        UInt8(min_=-1)
 
-@raises(ValueError)
 def test_uint8_max():
     '''Test UInt8 cannot be restricted with out of range max_ value'''
-    UInt8(max_=0x100)
+    with pytest.raises(ValueError):
+        UInt8(max_=0x100)
 
 class TestUInt8Restricted(_TestValueType):
     '''Test :class:`UInt8` with restricted range.'''
     value_type = UInt8(min_=6, max_=8)
-    type_name = 'UInt8(6..8)'
     attrs = (
         ('min_', 6),
         ('max_', 8),
@@ -189,20 +202,19 @@ class TestUInt16(_TestValueType):
         -1, 65536, '-2', '0x010000',
     )
 
-@raises(ValueError)
 def test_uint16_min():
     '''Test UInt16 cannot be restricted with negative min_ value'''
-    UInt16(min_=-1)
+    with pytest.raises(ValueError):
+        UInt16(min_=-1)
 
-@raises(ValueError)
 def test_uint16_max():
     '''Test UInt16 cannot be restricted with out of range max_ value'''
-    UInt16(max_=0x10000)
+    with pytest.raises(ValueError):
+        UInt16(max_=0x10000)
 
 class TestUInt16Restricted(_TestValueType):
     '''Test :class:`UInt16` with restricted range.'''
     value_type = UInt16(min_=996, max_=998)
-    type_name = 'UInt16(996..998)'
     attrs = (
         ('min_', 996),
         ('max_', 998),
@@ -232,20 +244,19 @@ class TestUInt32(_TestValueType):
         -1, 4294967296, '-2', '0x100000000',
     )
 
-@raises(ValueError)
 def test_uint32_min():
     '''Test UInt32 cannot be restricted with negative min_ value'''
-    UInt32(min_=-1)
+    with pytest.raises(ValueError):
+        UInt32(min_=-1)
 
-@raises(ValueError)
 def test_uint32_max():
     '''Test UInt32 cannot be restricted with out of range max_ value'''
-    UInt32(max_=0x100000000)
+    with pytest.raises(ValueError):
+        UInt32(max_=0x100000000)
 
 class TestUInt32Restricted(_TestValueType):
     '''Test :class:`UInt32` with restricted range.'''
     value_type = UInt32(min_=0xFFFFFFF0, max_=0xFFFFFFF4)
-    type_name = 'UInt32(0xFFFFFFF0..0xFFFFFFF4)'
     attrs = (
         ('min_', 4294967280),
         ('max_', 4294967284),
@@ -275,22 +286,14 @@ class TestIPv4(_TestValueType):
     )
     rejects_value = (
         'foo', '1.2.3', '256.0.0.0',
-    ) + (
-        None,
-        False, True,
-        -1, 0, 1,
-        -2.3, 0.1, 4.8,
-        (), ('1.2.3.4',),
-        [], ['0.0.0.0',],
-        {}, {'255.255.255.255': '0.0.0.0'},
-    )
+    ) + _NON_IP_INPUTS
     accepts_encode = (
         ('0.0.0.0', b'\x00\x00\x00\x00'),
         ('1.2.3.4', b'\x01\x02\x03\x04'),
         ('255.255.255.255', b'\xFF\xFF\xFF\xFF'),
     )
     rejects_encode = rejects_value
-    accepts_decode = tuple([(_[1], _[0]) for _ in accepts_encode])
+    accepts_decode = tuple((out, in_) for (in_, out) in accepts_encode)
     rejects_decode = rejects_value + (
         b'\x00',
         b'\x00\x00',
@@ -316,15 +319,7 @@ class TestNulTerminatedString(_TestValueType):
         'bar' * 3 + 'b',
         u'ìë' * 5,
         u'실례@', ### short enough, but cannot encode
-    ) + (
-        None,
-        False, True,
-        -1, 0, 1,
-        -2.3, 0.1, 4.8,
-        (), ('baz',),
-        [], ['baz',],
-        {}, {'baz': 'quux'},
-    )
+    ) + _NON_STR_INPUTS
     accepts_encode = (
         ('', b''),
         ('foo', b'foo'),
@@ -333,7 +328,7 @@ class TestNulTerminatedString(_TestValueType):
         (u'ìë' * 4, b'\xec\xeb' * 4),
     )
     rejects_encode = rejects_value
-    accepts_decode = tuple([(_[1], _[0]) for _ in accepts_encode]) + (
+    accepts_decode = tuple((out, in_) for (in_, out) in accepts_encode) + (
         (b'\x00', ''),
         (b'\xec\xeb', u'ìë'),
         ### oversize binary string but only because of zero padding
@@ -348,7 +343,6 @@ class TestNulTerminatedString(_TestValueType):
 class TestNulTerminatedUTF8(_TestValueType):
     '''Test :class:`NulTerminatedString` for utf-8 encoding.'''
     value_type = NulTerminatedString(33, encoding='utf-8')
-    type_name = 'NulTerminatedString(encoding="utf-8")'
     attrs = (
         ('max_', 33),
         ('encoding', 'utf-8'),
@@ -363,15 +357,7 @@ class TestNulTerminatedUTF8(_TestValueType):
     rejects_value = (
         'bar' * 11,
         u'실' * 11,
-    ) + (
-        None,
-        False, True,
-        -1, 0, 1,
-        -2.3, 0.1, 4.8,
-        (), ('baz',),
-        [], ['baz',],
-        {}, {'baz': 'quux'},
-    )
+    ) + _NON_STR_INPUTS
     accepts_encode = (
         ('', b''),
         ('foo', b'foo'),
@@ -381,10 +367,12 @@ class TestNulTerminatedUTF8(_TestValueType):
         ),
     )
     rejects_encode = rejects_value
-    accepts_decode = tuple([(_[1], _[0]) for _ in accepts_encode]) + (
+    accepts_decode = tuple((out, in_) for (in_, out) in accepts_encode) + (
         (b'\x00', ''),
         ### oversize binary string but only because of zero padding
         (b'\xec\x8b\xa4\xeb\xa1\x80' + b'\x00' * 30, u'실례'),
+        ### octets after the NUL terminator are discarded without being decoded
+        (b'foo\x00\xff\xfe', 'foo'),
     )
     rejects_decode = rejects_value + (
         b'bar' * 11,
@@ -396,36 +384,24 @@ class TestHexString(_TestValueType):
     value_type = HexString(6)
     attrs = (
         ('max_', 6),
+        ('strip_trailing_nul', False),
         ('sfmt', '6s'),
     )
+    ### letter case variants are tested by test_accepts_any_case
     accepts_value = (
         ('', ''),
         ('0a', '0a'),
-        ('0A', '0A'),
         ('0a:1b', '0a:1b'),
-        ('0a:1B', '0a:1B'),
-        ('0A:1B', '0A:1B'),
         ('0a:1b:c2:d3:4e:5f', '0a:1b:c2:d3:4e:5f'),
-        ('0a:1B:c2:D3:4e:5F', '0a:1B:c2:D3:4e:5F'),
-        ('0A:1B:C2:D3:4E:5F', '0A:1B:C2:D3:4E:5F'),
         ('00:00:00:00:00:00', '00:00:00:00:00:00'),
         ('ff:ff:ff:ff:ff:ff', 'ff:ff:ff:ff:ff:ff'),
-        ('ff:ff:ff:FF:FF:FF', 'ff:ff:ff:FF:FF:FF'),
-        ('FF:FF:FF:FF:FF:FF', 'FF:FF:FF:FF:FF:FF'),
     )
     rejects_value = (
         'foo', 'foo:bar',
         'X', 'Y:0A', '00:Z', '01:X:AB',
         'ABC', 'AB C', 'A B C',
-    ) + (
-        None,
-        False, True,
-        -1, 0, 1,
-        -2.3, 0.1, 4.8,
-        (), ('AB',),
-        [], ['AB',],
-        {}, {'AB': 'CD'},
-    )
+        '0a:1b:c2:d3:4e:5f:60', '::::::',
+    ) + _NON_HEX_INPUTS
     accepts_encode = (
         ('', b''),
         ('0a', b'\x0A'),
@@ -435,31 +411,68 @@ class TestHexString(_TestValueType):
         ('ff:ff:ff:ff:ff:ff', b'\xFF\xFF\xFF\xFF\xFF\xFF'),
     )
     rejects_encode = rejects_value
-    accepts_decode = tuple([(_[1], _[0]) for _ in accepts_encode])
-    rejects_decode = (
-        None,
-        False, True,
-        -1, 0, 1,
-        -2.3, 0.1, 4.8,
-        (), ('AB',),
-        [], ['AB',],
-        {}, {'AB': 'CD'},
-    ) + (
+    accepts_decode = tuple((out, in_) for (in_, out) in accepts_encode)
+    rejects_decode = _NON_HEX_INPUTS + (
         b'\x00\x00\x00\x00\x00\x00\x00',
         b'\xFF\xFF\xFF\xFF\xFF\xFF\xFF',
     )
+    @pytest.mark.parametrize(
+        'in_',
+        ('0a:1b:c2:d3:4e:5f', '0A:1B:C2:D3:4E:5F', '0a:1B:c2:D3:4e:5F'),
+        ids=('lower', 'upper', 'mixed'),
+    )
+    def test_accepts_any_case(self, in_):
+        '''Test HexString accepts and encodes hexadecimal digits of either letter case'''
+        assert self.value_type(in_) == in_
+        assert self.value_type.encode(in_) == b'\x0A\x1B\xC2\xD3\x4E\x5F'
     def test_truncate(self):
         '''Test HexString truncate method'''
-        assert_equal(self.value_type.truncate('', 3), '')
-        assert_equal(self.value_type.truncate('00', 3), '00')
-        assert_equal(self.value_type.truncate('00:11:22', 3), '00:11:22')
-        assert_equal(self.value_type.truncate('00:11:22:33', 3), '00:11:22')
-        assert_equal(self.value_type.truncate('00:11:22:33:44:55', 3), '00:11:22')
+        assert self.value_type.truncate('', 3) == ''
+        assert self.value_type.truncate('00', 3) == '00'
+        assert self.value_type.truncate('00:11:22', 3) == '00:11:22'
+        assert self.value_type.truncate('00:11:22:33', 3) == '00:11:22'
+        assert self.value_type.truncate('00:11:22:33:44:55', 3) == '00:11:22'
+
+class TestHexStringStripTrailingNul(_TestValueType):
+    '''Test :class:`HexString` discarding trailing zero bytes when decoding.'''
+    value_type = HexString(16, strip_trailing_nul=True)
+    attrs = (
+        ('max_', 16),
+        ('strip_trailing_nul', True),
+        ('sfmt', '16s'),
+    )
+    accepts_value = (
+        ('', ''),
+        ('1e:4b:ad:91:68:3a', '1e:4b:ad:91:68:3a'),
+        ('1e:4b:ad:91:68:3a:00:00', '1e:4b:ad:91:68:3a:00:00'),
+    )
+    rejects_value = (
+        'foo', '00:' * 16 + '00',
+    ) + _NON_HEX_INPUTS
+    accepts_encode = (
+        ('', b''),
+        ('1e:4b:ad:91:68:3a', b'\x1E\x4B\xAD\x91\x68\x3A'),
+        ('1e:4b:ad:91:68:3a:00:00', b'\x1E\x4B\xAD\x91\x68\x3A\x00\x00'),
+    )
+    rejects_encode = rejects_value
+    accepts_decode = (
+        (b'', ''),
+        (b'\x00' * 16, ''),
+        (b'\x1E\x4B\xAD\x91\x68\x3A', '1e:4b:ad:91:68:3a'),
+        ### value zero right padded to fixed field size
+        (b'\x1E\x4B\xAD\x91\x68\x3A' + b'\x00' * 10, '1e:4b:ad:91:68:3a'),
+        ### only trailing zero bytes are discarded
+        (b'\x00\x01\x00\x02\x00\x00', '00:01:00:02'),
+        ### ...including those of the value itself: a hardware address ending in 00 loses octets
+        (b'\x1E\x4B\xAD\x91\x68\x00' + b'\x00' * 10, '1e:4b:ad:91:68'),
+    )
+    rejects_decode = _NON_HEX_INPUTS + (
+        b'\x00' * 17,
+    )
 
 ### pylint: disable=too-few-public-methods,unsubscriptable-object,no-member
 
-@add_metaclass(Value)
-class Simple(object):
+class Simple(metaclass=Value):
     '''A simple message class/structured value for testing: only specifies field :attr:`spec`.'''
     name = 'simple message for testing'
     spec = (
@@ -468,100 +481,124 @@ class Simple(object):
         ('baz', IPv4()),
     )
 
-def test_simple_success():
+@pytest.fixture(scope='module')
+def simple_template():
+    '''Return a populated :class:`Simple` instance, which tests copy rather than modify. Fail at
+       module teardown if any test modified it.
+    '''
+    template = Simple(foo=0x48, bar='quuz', baz='192.168.1.1')
+    yield template
+    assert {'foo': 72, 'bar': 'quuz', 'baz': '192.168.1.1'} == template
+
+def test_simple_success(simple_template): ### pylint: disable=redefined-outer-name
     '''Test Value-based class as a dict'''
-    ### create like a dict
-    simple = Simple(foo=0x48, bar='quuz', baz='192.168.1.1')
+    ### create like a dict, from a mapping
+    simple = Simple(simple_template)
     ### is a dict
-    assert_equal(True, isinstance(simple, dict))
+    assert isinstance(simple, dict)
     ### has dict value
-    assert_equal({'foo': 72, 'bar': 'quuz', 'baz': '192.168.1.1'}, simple)
+    assert {'foo': 72, 'bar': 'quuz', 'baz': '192.168.1.1'} == simple
     ### has keys
-    assert_equal(simple['foo'], 72)
-    assert_equal(simple['bar'], 'quuz')
-    assert_equal(simple['baz'], '192.168.1.1')
+    assert simple['foo'] == 72
+    assert simple['bar'] == 'quuz'
+    assert simple['baz'] == '192.168.1.1'
     ### del key
     del simple['bar']
-    assert_equal({'foo': 72, 'baz': '192.168.1.1'}, simple)
-    assert_equal(simple['foo'], 72)
-    raises(KeyError)(lambda s=simple: s['bar'])()
-    assert_equal(simple['baz'], '192.168.1.1')
+    assert {'foo': 72, 'baz': '192.168.1.1'} == simple
+    assert simple['foo'] == 72
+    with pytest.raises(KeyError):
+        simple['bar'] ### pylint: disable=pointless-statement
+    assert simple['baz'] == '192.168.1.1'
     ### has update method
     simple.update(bar='thud', baz='10.0.0.8')
-    assert_equal({'foo': 72, 'bar': 'thud', 'baz': '10.0.0.8'}, simple)
-    assert_equal(simple['foo'], 72)
-    assert_equal(simple['bar'], 'thud')
-    assert_equal(simple['baz'], '10.0.0.8')
+    assert {'foo': 72, 'bar': 'thud', 'baz': '10.0.0.8'} == simple
+    assert simple['foo'] == 72
+    assert simple['bar'] == 'thud'
+    assert simple['baz'] == '10.0.0.8'
     ### only updates if all good
-    raises(ValueError)(lambda s=simple: s.update(foo=9, bar='corge', baz='not an IP address'))()
-    assert_equal({'foo': 72, 'bar': 'thud', 'baz': '10.0.0.8'}, simple)
-    assert_equal(simple['foo'], 72)
-    assert_equal(simple['bar'], 'thud')
-    assert_equal(simple['baz'], '10.0.0.8')
+    with pytest.raises(ValueError):
+        simple.update(foo=9, bar='corge', baz='not an IP address')
+    assert {'foo': 72, 'bar': 'thud', 'baz': '10.0.0.8'} == simple
+    assert simple['foo'] == 72
+    assert simple['bar'] == 'thud'
+    assert simple['baz'] == '10.0.0.8'
 
-@raises(KeyError)
 def test_simple_set_bad_key():
     '''Test Value-based class set rejects bad key'''
     simple = Simple()
-    simple['quux'] = True
+    with pytest.raises(KeyError):
+        simple['quux'] = True
 
-@raises(TypeError)
 def test_simple_set_bad_type():
     '''Test Value-based class set rejects bad value type'''
     simple = Simple()
-    simple['foo'] = {'a': 'b'}
+    with pytest.raises(TypeError):
+        simple['foo'] = {'a': 'b'}
 
-@raises(ValueError)
 def test_simple_set_bad_value():
     '''Test Value-based class set rejects bad value'''
     simple = Simple()
-    simple['foo'] = 'not an integer'
+    with pytest.raises(ValueError):
+        simple['foo'] = 'not an integer'
 
-@raises(KeyError)
 def test_simple_update_bad_key():
     '''Test Value-based class update rejects bad key'''
     simple = Simple()
-    simple.update(quux=True)
+    with pytest.raises(KeyError):
+        simple.update(quux=True)
 
-@raises(TypeError)
 def test_simple_update_bad_type():
     '''Test Value-based class update rejects bad value type'''
     simple = Simple()
-    simple.update((('foo', {'a': 'b'}),))
+    with pytest.raises(TypeError):
+        simple.update((('foo', {'a': 'b'}),))
 
-@raises(ValueError)
 def test_simple_update_bad_value():
     '''Test Value-based class update rejects bad value'''
     simple = Simple()
-    simple.update({'foo': 'not an integer'})
+    with pytest.raises(ValueError):
+        simple.update({'foo': 'not an integer'})
+
+def test_simple_subclass():
+    '''Test Value-based class can be subclassed'''
+    class Derived(Simple): ### pylint: disable=missing-docstring
+        pass
+    derived = Derived(foo=0x48)
+    derived['bar'] = 'quuz'
+    derived.update(baz='192.168.1.1')
+    assert {'foo': 72, 'bar': 'quuz', 'baz': '192.168.1.1'} == derived
+
+### :class:`Simple` {'foo': 0xFEDCBA98, 'bar': 'quuz', 'baz': '192.168.1.1'} encoded
+_SIMPLE_ENCODED = (
+    ### UInt32 in network-byte order
+    b'\xfe\xdc\xba\x98' +
+    ### NulTerminatedString zero right padded to fixed field size
+    b'quuz' + b'\0' * 12 +
+    ### IPv4 in network-byte order
+    b'\xc0\xa8\x01\x01'
+)
+
+### :class:`Simple` {'foo': 99, 'bar': 'corge', 'baz': '10.6.0.7'} encoded, with extra octets
+_SIMPLE_DECODE_INPUT = (
+    ### UInt32 in network-byte order
+    b'\x00\x00\x00\x63' +
+    ### NulTerminatedString zero right padded to fixed field size and literally "corrupted"
+    b'corge' + b'\0' + b'corrupted' + b'\0' +
+    ### IPv4 in network-byte order
+    b'\x0a\x06\x00\x07' +
+    ### trailing stuff which should be ignored/discarded
+    b'gumph'
+)
 
 def test_simple_encode():
     '''Test Value-based class encode method'''
     simple = Simple({'foo': 0xFEDCBA98, 'bar': 'quuz', 'baz': '192.168.1.1'})
-    assert_equal(
-        simple.encode(),
-        ### UInt32 in network-byte order
-        b'\xfe\xdc\xba\x98' +
-        ### NulTerminatedString zero right padded to fixed field size
-        b'quuz' + b'\0' * 12 +
-        ### IPv4 in network-byte order
-        b'\xc0\xa8\x01\x01'
-    )
+    assert simple.encode() == _SIMPLE_ENCODED
 
 def test_simple_decode():
     '''Test Value-based class decode method'''
-    encoded = (
-        ### UInt32 in network-byte order
-        b'\x00\x00\x00\x63' +
-        ### NulTerminatedString zero right padded to fixed field size and literally "corrupted"
-        b'corge' + b'\0' + b'corrupted' + b'\0' +
-        ### IPv4 in network-byte order
-        b'\x0a\x06\x00\x07' +
-        ### trailing stuff which should be ignored/discarded
-        b'gumph'
-    )
-    simple = Simple.decode(encoded)
-    assert_equal({'foo': 99, 'bar': 'corge', 'baz': '10.6.0.7'}, simple)
+    simple = Simple.decode(_SIMPLE_DECODE_INPUT)
+    assert {'foo': 99, 'bar': 'corge', 'baz': '10.6.0.7'} == simple
 
 class Ethernet(object):
     '''A class for testing custom bases are supported.'''
@@ -574,8 +611,7 @@ class Ethernet(object):
         elems[0] = '{:02x}'.format(int(elems[0], base=16) & 0xFE)
         self[self.key] = ':'.join(elems)
 
-@add_metaclass(Value)
-class Custom(Ethernet):
+class Custom(Ethernet, metaclass=Value):
     '''A custom message class/structured value for testing.'''
     name = 'custom message for testing'
     spec = (
@@ -592,9 +628,9 @@ class Custom(Ethernet):
 def test_custom_success():
     '''Test Value-based class supports customisation'''
     custom = Custom((('len', 6), ('mac', '11:22:33:44:55:66'))) ### pylint: disable=too-many-function-args
-    assert_equal({'len': 6, 'mac': '11:22:33:44:55:66'}, custom)
+    assert {'len': 6, 'mac': '11:22:33:44:55:66'} == custom
     ### supports custom __init__ and custom attributes
-    assert_equal('mac', custom.key)
+    assert 'mac' == custom.key
     ### supports custom methods
     custom.make_unicast()
-    assert_equal({'len': 6, 'mac': '10:22:33:44:55:66'}, custom)
+    assert {'len': 6, 'mac': '10:22:33:44:55:66'} == custom
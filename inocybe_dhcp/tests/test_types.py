@@ -3,10 +3,7 @@
 
 '''Test cases for inocybe_dhcp.types.'''
 
-from nose.tools import assert_equal
-from nose.tools import raises
-
-from six import add_metaclass
+import pytest
 
 from inocybe_dhcp.types import (
     ValueType,
@@ -21,29 +18,32 @@ from inocybe_dhcp.types import (
 def test_value_type():
     '''Test inocybe_dhcp.types.ValueType default behaviours'''
     value_type = ValueType()
-    assert_equal(None, value_type.sfmt)
-    assert_equal('foo', value_type.encode('foo'))
-    assert_equal(-7.3, value_type.decode(-7.3))
+    assert value_type.sfmt is None
+    assert 'foo' == value_type.encode('foo')
+    assert -7.3 == value_type.decode(-7.3)
 
-@raises(NotImplementedError)
 def test_value_type_call_abstract():
     '''Test inocybe_dhcp.types.ValueType __call__() is abstract'''
-    ValueType()(None)
+    value_type = ValueType()
+    with pytest.raises(NotImplementedError):
+        value_type(None)
 
-@raises(NotImplementedError)
 def test_value_type_pack_abstract():
     '''Test inocybe_dhcp.types.ValueType pack() is abstract'''
-    ValueType().pack(None)
+    value_type = ValueType()
+    with pytest.raises(NotImplementedError):
+        value_type.pack(None)
 
-@raises(NotImplementedError)
 def test_value_type_unpack_abstract():
     '''Test inocybe_dhcp.types.ValueType unpack() is abstract'''
-    ValueType().unpack(None)
+    value_type = ValueType()
+    with pytest.raises(NotImplementedError):
+        value_type.unpack(None)
 
 class ValueTypeTest(object):
-    '''Common test procedures for a value type.'''
-    ### a custom type name to present in test case descriptions (default=class name of value type)
-    type_name = None
+    '''Common test procedures for a value type. Each test method is parametrized with the cases in
+       the class attribute named by :attr:`cases`, by the hook in conftest.py.
+    '''
     ### the value type instance under test
     value_type = None
     ### a sequence of (attribute name, expected value) which `value_type` must have
@@ -68,83 +68,58 @@ class ValueTypeTest(object):
     accepts_decode = ()
     ### a sequence of input values raising ValueError or TypeError for `value_type` decode call
     rejects_decode = ()
-    def __init__(self):
-        if self.type_name:
-            self.type_name = self.value_type.__module__ + '.' + self.type_name
-        else:
-            self.type_name = self.value_type.__module__ + '.' + self.value_type.__class__.__name__
-    def description(self, fmt, val):
-        '''Format and return `fmt` with :attr:`type_name`, class name of `val` and `val`.'''
-        try:
-            return fmt.format(self.type_name, val.__class__.__name__, val)
-        except UnicodeEncodeError:
-            return fmt.format(self.type_name, val.__class__.__name__, val.encode('utf-8'))
-    def test_attrs(self):
+    ### test method name: (parameter names, name of class attribute with the cases)
+    cases = {
+        'test_attrs': ('attr, val', 'attrs'),
+        'test_accepts_value': ('in_, out', 'accepts_value'),
+        'test_rejects_value': ('in_', 'rejects_value'),
+        'test_accepts_pack': ('in_, out', 'accepts_pack'),
+        'test_rejects_pack': ('in_', 'rejects_pack'),
+        'test_accepts_unpack': ('in_, out', 'accepts_unpack'),
+        'test_rejects_unpack': ('in_', 'rejects_unpack'),
+        'test_accepts_encode': ('in_, out', 'accepts_encode'),
+        'test_rejects_encode': ('in_', 'rejects_encode'),
+        'test_accepts_decode': ('in_, out', 'accepts_decode'),
+        'test_rejects_decode': ('in_', 'rejects_decode'),
+    }
+    def test_attrs(self, attr, val):
         '''Test value type has expected attribute values.'''
-        for (attr, val) in self.attrs:
-            func = lambda t=self.value_type, a=attr, v=val: assert_equal(getattr(t, a), v)
-            func.description = 'Test {} has {} attr value {}'.format(self.type_name, attr, val)
-            yield func
-    def test_accepts_value(self):
+        assert getattr(self.value_type, attr) == val
+    def test_accepts_value(self, in_, out):
         '''Test value type accepts values for direct call.'''
-        for (in_, out) in self.accepts_value:
-            func = lambda t=self.value_type, i=in_, o=out: assert_equal(t(i), o)
-            func.description = self.description('Test {} accepts value {} {}', in_)
-            yield func
-    def test_rejects_value(self):
+        assert self.value_type(in_) == out
+    def test_rejects_value(self, in_):
         '''Test value type rejects values for direct call.'''
-        for in_ in self.rejects_value:
-            func = raises(ValueError, TypeError)(lambda t=self.value_type, i=in_: t(i))
-            func.description = self.description('Test {} rejects value {} {}', in_)
-            yield func
-    def test_accepts_pack(self):
+        with pytest.raises((ValueError, TypeError)):
+            self.value_type(in_)
+    def test_accepts_pack(self, in_, out):
         '''Test value type accepts values for pack call.'''
-        for (in_, out) in self.accepts_pack:
-            func = lambda t=self.value_type, i=in_, o=out: assert_equal(t.pack(i), o)
-            func.description = self.description('Test {} accepts pack {} {}', in_)
-            yield func
-    def test_rejects_pack(self):
+        assert self.value_type.pack(in_) == out
+    def test_rejects_pack(self, in_):
         '''Test value type rejects values for pack call.'''
-        for in_ in self.rejects_pack:
-            func = raises(ValueError, TypeError)(lambda t=self.value_type, i=in_: t.pack(i))
-            func.description = self.description('Test {} rejects pack {} {}', in_)
-            yield func
-    def test_accepts_unpack(self):
+        with pytest.raises((ValueError, TypeError)):
+            self.value_type.pack(in_)
+    def test_accepts_unpack(self, in_, out):
         '''Test value type accepts values for unpack call.'''
-        for (in_, out) in self.accepts_unpack:
-            func = lambda t=self.value_type, i=in_, o=out: assert_equal(t.unpack(i), o)
-            func.description = self.description('Test {} accepts unpack {} {}', in_)
-            yield func
-    def test_rejects_unpack(self):
+        assert self.value_type.unpack(in_) == out
+    def test_rejects_unpack(self, in_):
         '''Test value type rejects values for unpack call.'''
-        for in_ in self.rejects_unpack:
-            func = raises(ValueError, TypeError)(lambda t=self.value_type, i=in_: t.unpack(i))
-            func.description = self.description('Test {} rejects unpack {} {}', in_)
-            yield func
-    def test_accepts_encode(self):
+        with pytest.raises((ValueError, TypeError)):
+            self.value_type.unpack(in_)
+    def test_accepts_encode(self, in_, out):
         '''Test value type accepts values for encode call.'''
-        for (in_, out) in self.accepts_encode:
-            func = lambda t=self.value_type, i=in_, o=out: assert_equal(t.encode(i), o)
-            func.description = self.description('Test {} accepts encode {} {}', in_)
-            yield func
-    def test_rejects_encode(self):
+        assert self.value_type.encode(in_) == out
+    def test_rejects_encode(self, in_):
         '''Test value type rejects values for encode call.'''
-        for in_ in self.rejects_encode:
-            func = raises(ValueError, TypeError)(lambda t=self.value_type, i=in_: t.encode(i))
-            func.description = self.description('Test {} rejects encode {} {}', in_)
-            yield func
-    def test_accepts_decode(self):
+        with pytest.raises((ValueError, TypeError)):
+            self.value_type.encode(in_)
+    def test_accepts_decode(self, in_, out):
         '''Test value type accepts values for decode call.'''
-        for (in_, out) in self.accepts_decode:
-            func = lambda t=self.value_type, i=in_, o=out: assert_equal(t.decode(i), o)
-            func.description = self.description('Test {} accepts decode {} {}', in_)
-            yield func
-    def test_rejects_decode(self):
+        assert self.value_type.decode(in_) == out
+    def test_rejects_decode(self, in_):
         '''Test value type rejects values for decode call.'''
-        for in_ in self.rejects_decode:
-            func = raises(ValueError, TypeError)(lambda t=self.value_type, i=in_: t.decode(i))
-            func.description = self.description('Test {} rejects decode {} {}', in_)
-            yield func
+        with pytest.raises((ValueError, TypeError)):
+            self.value_type.decode(in_)
 
 ### test accepts/rejects integers and stringy integers for all integer classes
 ### test accepts/rejects other native types only for base integer class
@@ -216,6 +191,24 @@ class TestEnum(ValueTypeTest):
     rejects_decode = (
         'foo', 'bar', 'baz', 'quux', 'thud', -2, 2, 4,
     )
+    def test_value_to_label_readonly(self):
+        '''Test inocybe_dhcp.types.Enum value_to_label cannot be modified'''
+        with pytest.raises(TypeError):
+            self.value_type.value_to_label[2] = 'thud'
+    def test_label_to_value_readonly(self):
+        '''Test inocybe_dhcp.types.Enum label_to_value cannot be modified'''
+        with pytest.raises(TypeError):
+            self.value_type.label_to_value['thud'] = 2
+
+class TestEnumOutOfRange(ValueTypeTest):
+    '''Test :class:`Enum` with a mapping entry outside its value range.'''
+    value_type = Enum(1, 8, 'B', ((1, 'a'), (9, 'z')))
+    accepts_value = (
+        (1, 'a'), ('1', 'a'), ('a', 'a'),
+    )
+    rejects_value = (
+        0, 9, '9', '0x9',
+    )
 
 class TestUInt8(ValueTypeTest):
     '''Test :class:`UInt8`.'''
@@ -234,20 +227,19 @@ class TestUInt8(ValueTypeTest):
         -1, 256, '-2', '0x100',
     )
 
-@raises(ValueError)
 def test_uint8_min():
     '''Test inocybe_dhcp.types.UInt8 cannot be restricted with negative min_ value'''
-    UInt8(min_=-1)
+    with pytest.raises(ValueError):
+        UInt8(min_=-1)
 
-@raises(ValueError)
 def test_uint8_max():
     '''Test inocybe_dhcp.types.UInt8 cannot be restricted with out of range max_ value'''
-    UInt8(max_=0x100)
+    with pytest.raises(ValueError):
+        UInt8(max_=0x100)
 
 class TestUInt8Restricted(ValueTypeTest):
     '''Test :class:`UInt8` with restricted range.'''
     value_type = UInt8(min_=6, max_=8)
-    type_name = 'UInt8(6..8)'
     attrs = (
         ('min_', 6),
         ('max_', 8),
@@ -277,20 +269,19 @@ class TestUInt16(ValueTypeTest):
         -1, 65536, '-2', '0x010000',
     )
 
-@raises(ValueError)
 def test_uint16_min():
     '''Test inocybe_dhcp.types.UInt16 cannot be restricted with negative min_ value'''
-    UInt16(min_=-1)
+    with pytest.raises(ValueError):
+        UInt16(min_=-1)
 
-@raises(ValueError)
 def test_uint16_max():
     '''Test inocybe_dhcp.types.UInt16 cannot be restricted with out of range max_ value'''
-    UInt16(max_=0x10000)
+    with pytest.raises(ValueError):
+        UInt16(max_=0x10000)
 
 class TestUInt16Restricted(ValueTypeTest):
     '''Test :class:`UInt16` with restricted range.'''
     value_type = UInt16(min_=996, max_=998)
-    type_name = 'UInt16(996..998)'
     attrs = (
         ('min_', 996),
         ('max_', 998),
@@ -320,20 +311,19 @@ class TestUInt32(ValueTypeTest):
         -1, 4294967296, '-2', '0x100000000',
     )
 
-@raises(ValueError)
 def test_uint32_min():
     '''Test inocybe_dhcp.types.UInt32 cannot be restricted with negative min_ value'''
-    UInt32(min_=-1)
+    with pytest.raises(ValueError):
+        UInt32(min_=-1)
 
-@raises(ValueError)
 def test_uint32_max():
     '''Test inocybe_dhcp.types.UInt32 cannot be restricted with out of range max_ value'''
-    UInt32(max_=0x100000000)
+    with pytest.raises(ValueError):
+        UInt32(max_=0x100000000)
 
 class TestUInt32Restricted(ValueTypeTest):
     '''Test :class:`UInt32` with restricted range.'''
     value_type = UInt32(min_=0xFFFFFFF0, max_=0xFFFFFFF4)
-    type_name = 'UInt32(0xFFFFFFF0..0xFFFFFFF4)'
     attrs = (
         ('min_', 4294967280),
         ('max_', 4294967284),
@@ -369,20 +359,19 @@ class TestSInt32(ValueTypeTest):
         '-0x80000001', '0x80000000',
     )
 
-@raises(ValueError)
 def test_sint32_min():
     '''Test inocybe_dhcp.types.SInt32 cannot be restricted with out of range min_ value'''
-    SInt32(min_=-0x80000001)
+    with pytest.raises(ValueError):
+        SInt32(min_=-0x80000001)
 
-@raises(ValueError)
 def test_sint32_max():
     '''Test inocybe_dhcp.types.SInt32 cannot be restricted with out of range max_ value'''
-    SInt32(max_=0x80000000)
+    with pytest.raises(ValueError):
+        SInt32(max_=0x80000000)
 
 class TestSInt32Restricted(ValueTypeTest):
     '''Test :class:`SInt32` with restricted range.'''
     value_type = SInt32(min_=-3, max_=4)
-    type_name = 'SInt32(-3..4)'
     attrs = (
         ('min_', -3),
         ('max_', 4),
@@ -430,7 +419,7 @@ class TestIPv4(ValueTypeTest):
         ('255.255.255.255', b'\xFF\xFF\xFF\xFF'),
     )
     rejects_encode = rejects_value
-    accepts_decode = tuple([(_[1], _[0]) for _ in accepts_encode])
+    accepts_decode = tuple((out, in_) for (in_, out) in accepts_encode)
     rejects_decode = rejects_value + (
         b'\x00',
         b'\x00\x00',
@@ -473,7 +462,7 @@ class TestNulTerminatedString(ValueTypeTest):
         (u'ìë' * 4, b'\xec\xeb' * 4),
     )
     rejects_encode = rejects_value
-    accepts_decode = tuple([(_[1], _[0]) for _ in accepts_encode]) + (
+    accepts_decode = tuple((out, in_) for (in_, out) in accepts_encode) + (
         (b'\x00', ''),
         (b'\xec\xeb', u'ìë'),
         ### oversize binary string but only because of zero padding
@@ -488,7 +477,6 @@ class TestNulTerminatedString(ValueTypeTest):
 class TestNulTerminatedUTF8(ValueTypeTest):
     '''Test :class:`NulTerminatedString` for utf-8 encoding.'''
     value_type = NulTerminatedString(33, encoding='utf-8')
-    type_name = 'NulTerminatedString(encoding="utf-8")'
     attrs = (
         ('max_', 33),
         ('encoding', 'utf-8'),
@@ -521,10 +509,12 @@ class TestNulTerminatedUTF8(ValueTypeTest):
         ),
     )
     rejects_encode = rejects_value
-    accepts_decode = tuple([(_[1], _[0]) for _ in accepts_encode]) + (
+    accepts_decode = tuple((out, in_) for (in_, out) in accepts_encode) + (
         (b'\x00', ''),
         ### oversize binary string but only because of zero padding
         (b'\xec\x8b\xa4\xeb\xa1\x80' + b'\x00' * 30, u'실례'),
+        ### octets after the NUL terminator are discarded without being decoded
+        (b'foo\x00\xff\xfe', 'foo'),
     )
     rejects_decode = rejects_value + (
         b'bar' * 11,
@@ -575,7 +565,7 @@ class TestHexString(ValueTypeTest):
         ('ff:ff:ff:ff:ff:ff', b'\xFF\xFF\xFF\xFF\xFF\xFF'),
     )
     rejects_encode = rejects_value
-    accepts_decode = tuple([(_[1], _[0]) for _ in accepts_encode])
+    accepts_decode = tuple((out, in_) for (in_, out) in accepts_encode)
     rejects_decode = (
         None,
         False, True,
@@ -590,16 +580,44 @@ class TestHexString(ValueTypeTest):
     )
     def test_truncate(self):
         '''Test inocybe_dhcp.types.HexString truncate method'''
-        assert_equal(self.value_type.truncate('', 3), '')
-        assert_equal(self.value_type.truncate('00', 3), '00')
-        assert_equal(self.value_type.truncate('00:11:22', 3), '00:11:22')
-        assert_equal(self.value_type.truncate('00:11:22:33', 3), '00:11:22')
-        assert_equal(self.value_type.truncate('00:11:22:33:44:55', 3), '00:11:22')
+        assert self.value_type.truncate('', 3) == ''
+        assert self.value_type.truncate('00', 3) == '00'
+        assert self.value_type.truncate('00:11:22', 3) == '00:11:22'
+        assert self.value_type.truncate('00:11:22:33', 3) == '00:11:22'
+        assert self.value_type.truncate('00:11:22:33:44:55', 3) == '00:11:22'
+
+class TestHexStringLong(ValueTypeTest):
+    '''Test :class:`HexString` with values long enough to be decoded using :func:`hexlify`.'''
+    value_type = HexString(40)
+    attrs = (
+        ('max_', 40),
+        ('sfmt', '40s'),
+    )
+    accepts_value = (
+        (':'.join(['0a'] * 40), ':'.join(['0a'] * 40)),
+        (':'.join(['a'] * 40), ':'.join(['a'] * 40)),
+    )
+    rejects_value = (
+        ':'.join(['0a'] * 41),
+        ':'.join(['0a'] * 39) + ':0x',
+        ':'.join(['0a'] * 39) + ':a0a',
+    )
+    accepts_encode = (
+        (':'.join(['{:02x}'.format(_) for _ in range(40)]), bytes(bytearray(range(40)))),
+        (':'.join(['{:02X}'.format(_) for _ in range(200, 240)]),
+         bytes(bytearray(range(200, 240)))),
+        (':'.join(['{:02x}'.format(_) for _ in range(32)]), bytes(bytearray(range(32)))),
+        (':'.join(['{:02x}'.format(_) for _ in range(31)]), bytes(bytearray(range(31)))),
+    )
+    rejects_encode = rejects_value
+    accepts_decode = tuple((out, in_.lower()) for (in_, out) in accepts_encode)
+    rejects_decode = (
+        bytes(bytearray(41)),
+    )
 
 ### pylint: disable=too-few-public-methods,unsubscriptable-object,no-member
 
-@add_metaclass(StructuredValue)
-class Simple(object):
+class Simple(metaclass=StructuredValue):
     '''A simple message class/structured value for testing: only specifies field :attr:`spec`.'''
     name = 'simple message for testing'
     spec = (
@@ -613,73 +631,74 @@ def test_simple_success():
     ### create like a dict
     simple = Simple(foo=0x48, bar='quuz', baz='192.168.1.1')
     ### is a dict
-    assert_equal(True, isinstance(simple, dict))
+    assert isinstance(simple, dict)
     ### has dict value
-    assert_equal({'foo': 72, 'bar': 'quuz', 'baz': '192.168.1.1'}, simple)
+    assert {'foo': 72, 'bar': 'quuz', 'baz': '192.168.1.1'} == simple
     ### has keys
-    assert_equal(simple['foo'], 72)
-    assert_equal(simple['bar'], 'quuz')
-    assert_equal(simple['baz'], '192.168.1.1')
+    assert simple['foo'] == 72
+    assert simple['bar'] == 'quuz'
+    assert simple['baz'] == '192.168.1.1'
     ### del key
     del simple['bar']
-    assert_equal({'foo': 72, 'baz': '192.168.1.1'}, simple)
-    assert_equal(simple['foo'], 72)
-    raises(KeyError)(lambda s=simple: s['bar'])()
-    assert_equal(simple['baz'], '192.168.1.1')
+    assert {'foo': 72, 'baz': '192.168.1.1'} == simple
+    assert simple['foo'] == 72
+    with pytest.raises(KeyError):
+        simple['bar'] ### pylint: disable=pointless-statement
+    assert simple['baz'] == '192.168.1.1'
     ### has update method
     simple.update(bar='thud', baz='10.0.0.8')
-    assert_equal({'foo': 72, 'bar': 'thud', 'baz': '10.0.0.8'}, simple)
-    assert_equal(simple['foo'], 72)
-    assert_equal(simple['bar'], 'thud')
-    assert_equal(simple['baz'], '10.0.0.8')
+    assert {'foo': 72, 'bar': 'thud', 'baz': '10.0.0.8'} == simple
+    assert simple['foo'] == 72
+    assert simple['bar'] == 'thud'
+    assert simple['baz'] == '10.0.0.8'
     ### only updates if all good
-    raises(ValueError)(lambda s=simple: s.update(foo=9, bar='corge', baz='not an IP address'))()
-    assert_equal({'foo': 72, 'bar': 'thud', 'baz': '10.0.0.8'}, simple)
-    assert_equal(simple['foo'], 72)
-    assert_equal(simple['bar'], 'thud')
-    assert_equal(simple['baz'], '10.0.0.8')
+    with pytest.raises(ValueError):
+        simple.update(foo=9, bar='corge', baz='not an IP address')
+    assert {'foo': 72, 'bar': 'thud', 'baz': '10.0.0.8'} == simple
+    assert simple['foo'] == 72
+    assert simple['bar'] == 'thud'
+    assert simple['baz'] == '10.0.0.8'
 
-@raises(KeyError)
 def test_simple_set_bad_key():
     '''Test inocybe_dhcp.types.StructuredValue-based class set rejects bad key'''
     simple = Simple()
-    simple['quux'] = True
+    with pytest.raises(KeyError):
+        simple['quux'] = True
 
-@raises(TypeError)
 def test_simple_set_bad_type():
     '''Test inocybe_dhcp.types.StructuredValue-based class set rejects bad value type'''
     simple = Simple()
-    simple['foo'] = {'a': 'b'}
+    with pytest.raises(TypeError):
+        simple['foo'] = {'a': 'b'}
 
-@raises(ValueError)
 def test_simple_set_bad_value():
     '''Test inocybe_dhcp.types.StructuredValue-based class set rejects bad value'''
     simple = Simple()
-    simple['foo'] = 'not an integer'
+    with pytest.raises(ValueError):
+        simple['foo'] = 'not an integer'
 
-@raises(KeyError)
 def test_simple_update_bad_key():
     '''Test inocybe_dhcp.types.StructuredValue-based class update rejects bad key'''
     simple = Simple()
-    simple.update(quux=True)
+    with pytest.raises(KeyError):
+        simple.update(quux=True)
 
-@raises(TypeError)
 def test_simple_update_bad_type():
     '''Test inocybe_dhcp.types.StructuredValue-based class update rejects bad value type'''
     simple = Simple()
-    simple.update((('foo', {'a': 'b'}),))
+    with pytest.raises(TypeError):
+        simple.update((('foo', {'a': 'b'}),))
 
-@raises(ValueError)
 def test_simple_update_bad_value():
     '''Test inocybe_dhcp.types.StructuredValue-based class update rejects bad value'''
     simple = Simple()
-    simple.update({'foo': 'not an integer'})
+    with pytest.raises(ValueError):
+        simple.update({'foo': 'not an integer'})
 
 def test_simple_pack():
     '''Test inocybe_dhcp.types.StructuredValue-based class pack method'''
     simple = Simple({'foo': 0xFEDCBA98, 'bar': 'quuz', 'baz': '192.168.1.1'})
-    assert_equal(
-        simple.pack(),
+    packed = (
         ### UInt32 in network-byte order
         b'\xfe\xdc\xba\x98' +
         ### NulTerminatedString zero right padded to fixed field size
@@ -687,6 +706,7 @@ def test_simple_pack():
         ### IPv4 in network-byte order
         b'\xc0\xa8\x01\x01'
     )
+    assert simple.pack() == packed
 
 def test_simple_unpack():
     '''Test inocybe_dhcp.types.StructuredValue-based class unpack method'''
@@ -701,7 +721,7 @@ def test_simple_unpack():
         b'gumph'
     )
     simple = Simple.unpack(packed)
-    assert_equal({'foo': 99, 'bar': 'corge', 'baz': '10.6.0.7'}, simple)
+    assert {'foo': 99, 'bar': 'corge', 'baz': '10.6.0.7'} == simple
 
 class Ethernet(object):
     '''A class for testing custom bases are supported.'''
@@ -714,8 +734,7 @@ class Ethernet(object):
         elems[0] = '{:02x}'.format(int(elems[0], base=16) & 0xFE)
         self[self.key] = ':'.join(elems)
 
-@add_metaclass(StructuredValue)
-class Custom(Ethernet):
+class Custom(Ethernet, metaclass=StructuredValue):
     '''A custom message class/structured value for testing.'''
     name = 'custom message for testing'
     spec = (
@@ -732,9 +751,9 @@ class Custom(Ethernet):
 def test_custom_success():
     '''Test inocybe_dhcp.types.StructuredValue-based class supports customisation'''
     custom = Custom((('len', 6), ('mac', '11:22:33:44:55:66'))) ### pylint: disable=too-many-function-args
-    assert_equal({'len': 6, 'mac': '11:22:33:44:55:66'}, custom)
+    assert {'len': 6, 'mac': '11:22:33:44:55:66'} == custom
     ### supports custom __init__ and custom attributes
-    assert_equal('mac', custom.key)
+    assert 'mac' == custom.key
     ### supports custom methods
     custom.make_unicast()
-    assert_equal({'len': 6, 'mac': '10:22:33:44:55:66'}, custom)
+    assert {'len': 6, 'mac': '10:22:33:44:55:66'} == custom
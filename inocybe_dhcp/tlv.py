@@ -3,6 +3,7 @@
 '''Type-Length-Value encoding and decoding support.'''
 
 from collections import OrderedDict
+from functools import lru_cache
 
 from struct import Struct
 from socket import AF_INET, inet_ntop, inet_pton
@@ -10,6 +11,48 @@ from socket import error as SocketError
 
 from six import (binary_type, iterbytes, PY2, int2byte)
 
+@lru_cache(maxsize=None)
+def _cached_struct(fmt):
+    '''Return a :class:`Struct` for format string `fmt`, shared by all classes using that format.'''
+    return Struct(fmt)
+
+### Encoding a string value is a pure function of (max encoded length, encoding, value) and returns
+### an immutable binary string, so encoded values can be cached for static values which recur in
+### many messages, such as host names and client identifiers. Each cache key MUST include every
+### value type attribute the encoding depends on: cached values would be stale if the encoding
+### depended on any mutable state.
+
+@lru_cache(maxsize=4096)
+def _encode_nul_terminated(max_, encoding, val):
+    '''Return the binary-encoded value of :class:`NulTerminatedString` string `val`.'''
+    try:
+        octets = val.encode(encoding)
+    except AttributeError:
+        pass
+    else:
+        if len(octets) < max_: ### allows at least 1 octet for NUL terminator
+            return octets
+    raise ValueError(val)
+
+@lru_cache(maxsize=4096)
+def _encode_hex(max_, val):
+    '''Return the binary-encoded value of :class:`HexString` hexadecimal string `val`.'''
+    try:
+        ### each element encodes to one octet: count elements before splitting and converting them
+        if val == '':
+            elems = []
+        elif val.count(':') < max_:
+            elems = val.split(':')
+        else:
+            raise ValueError(val)
+    except AttributeError:
+        pass
+    else:
+        if PY2:
+            return ''.join([int2byte(int(_, base=16)) for _ in elems])
+        return bytes([int(_, base=16) for _ in elems])
+    raise ValueError(val)
+
 class Int(object):
     '''A value type enforcing integer values between `min_` and `max_` inclusive. `sfmt` is the
        :module:`struct` format string for packing and unpacking values of this type.
@@ -36,16 +79,15 @@ class Int(object):
            from `val`, or is outside this type's value range, then raise :class:`ValueError` or
            :class:`TypeError`.
         '''
-        try:
-            val = int(val, base=0)
-        except TypeError:
-            val = int(val)
-        if val < self.min_:
-            raise ValueError(val)
-        elif self.max_ < val:
+        ### decoded values are already integers: only convert other lexical values
+        if type(val) is not int: ### pylint: disable=unidiomatic-typecheck
+            try:
+                val = int(val, base=0)
+            except TypeError:
+                val = int(val)
+        if val < self._min or self._max < val:
             raise ValueError(val)
-        else:
-            return val
+        return val
 
 class UInt8(Int):
     '''A value type enforcing unsigned integer values with a max range of 0 .. 0xFF.
@@ -148,14 +190,12 @@ class NulTerminatedString(object):
            binary-encoded value `octets`, with all characters after, and including, the first NUL
            terminator discarded. Otherwise, raise :class:`ValueError`.
         '''
+        ### split at the first NUL terminator so that discarded octets are not decoded
         try:
-            val = octets.decode(self.encoding)
-        except AttributeError:
+            val = octets.partition(b'\0')[0].decode(self.encoding)
+        except (AttributeError, TypeError):
             pass
         else:
-            idx = val.find('\0')
-            if idx != -1:
-                val = val[:idx]
             try:
                 return self(val)
             except ValueError:
@@ -167,25 +207,30 @@ class NulTerminatedString(object):
            :class:`ValueError`.
         '''
         try:
-            octets = val.encode(self.encoding)
-        except AttributeError:
-            pass
-        else:
-            if len(octets) < self.max_: ### allows at least 1 octet for NUL terminator
-                return octets
-        raise ValueError(val)
+            return _encode_nul_terminated(self._max, self._encoding, val)
+        except TypeError:
+            ### unhashable `val`, which cannot be a string
+            raise ValueError(val)
 
 class HexString(object):
     '''A value type enforcing colon-separated hexadecimal string values which have a max encoded
-       length of `max_` octets.
+       length of `max_` octets. If `strip_trailing_nul` is True, then trailing zero bytes (such as
+       the padding of a fixed size field) are discarded when decoding values. This also discards
+       any zero bytes which end the value itself, so it does not suit values such as hardware
+       addresses which may end in 00: decode those with their known length instead.
     '''
-    def __init__(self, max_):
+    def __init__(self, max_, strip_trailing_nul=False):
         self._max = int(max_)
+        self._strip_trailing_nul = bool(strip_trailing_nul)
     @property
     def max_(self):
         '''Return the maximum encoded value length accepted by this type.'''
         return self._max
     @property
+    def strip_trailing_nul(self):
+        '''Return True if trailing zero bytes are discarded when decoding values.'''
+        return self._strip_trailing_nul
+    @property
     def sfmt(self):
         '''Return the :module:`struct` format string for packing and unpacking values. Values are
            encoded into a field of fixed size, :attr:`max_` octets. The 's' format automatically
@@ -204,6 +249,8 @@ class HexString(object):
         '''
         ### note that Python 2 binary type is str, which this implementation will attempt to process
         if isinstance(octets, binary_type) and len(octets) <= self.max_:
+            if self._strip_trailing_nul:
+                octets = octets.rstrip(b'\0')
             return ':'.join(['{:02x}'.format(_) for _ in iterbytes(octets)])
         raise ValueError(octets)
     def encode(self, val):
@@ -212,17 +259,11 @@ class HexString(object):
            :class:`ValueError`.
         '''
         try:
-            elems = [] if val == '' else val.split(':')
-        except AttributeError:
-            pass
-        else:
-            if PY2:
-                octets = ''.join([int2byte(int(_, base=16)) for _ in elems])
-            else:
-                octets = bytes([int(_, base=16) for _ in elems]) ### pylint: disable=redefined-variable-type
-            if len(octets) <= self.max_:
-                return octets
-        raise ValueError(val)
+            return _encode_hex(self._max, val)
+        except TypeError:
+            ### `val` is unhashable, or its count() rejects a str argument (as bytes does): either
+            ### way, `val` is not a hexadecimal string
+            raise ValueError(val)
     @staticmethod
     def truncate(val, max_):
         '''Return a hexadecimal string value with at most `max_` elements from hexadecimal string
@@ -250,8 +291,8 @@ def _value_init(bases, body):
 
 def _value_setitem(self, key, val):
     '''A function for use as the __setitem__ method of a class built by :class:`Value`.'''
-    val = self.screen(key, val)
-    super(self.__class__, self).__setitem__(key, val)
+    ### :class:`Value` makes dict first in python MRO, so store directly rather than through super()
+    dict.__setitem__(self, key, _value_screen(self, key, val))
 
 def _value_screen(self, key, val):
     '''A function for use as the screen method of a class built by :class:`Value`.
@@ -262,9 +303,11 @@ def _value_screen(self, key, val):
        Otherwise, return the canonical value for field from lexical value.
     '''
     try:
-        return self.fields[key](val)
+        field = self.fields[key]
     except KeyError:
         raise KeyError('unsupported field for {}: {}'.format(self.name, key))
+    try:
+        return field(val)
     except ValueError:
         raise ValueError('bad value for {} field {}: {}'.format(self.name, key, val))
     except TypeError:
@@ -278,7 +321,7 @@ def _value_update(self, *args, **kwargs):
     ivals = dict(*args, **kwargs)
     for key in ivals:
         ivals[key] = self.screen(key, ivals[key])
-    super(self.__class__, self).update(ivals)
+    dict.update(self, ivals)
 
 def _value_encode(self):
     '''A function for use as the encode method of a class built by :class:`Value`.
@@ -286,23 +329,19 @@ def _value_encode(self):
        Raise :class:`KeyError` if any required field does not have a value in `self`.
     '''
     args = []
-    for key in self.fields:
+    for (key, encode) in self._encode_ops:
         val = self[key]
-        try:
-            val = self.fields[key].encode(val)
-        except AttributeError:
-            pass
+        if encode is not None:
+            val = encode(val)
         args.append(val)
-    return self.struct.pack(*args)
+    return self._pack(*args)
 
 def _value_decode(cls, octets):
     '''A function for use as the decode classmethod of a class built by :class:`Value`.'''
     args = {}
-    for (key, val) in zip(cls.fields, cls.struct.unpack_from(octets)):
-        try:
-            val = cls.fields[key].decode(val)
-        except AttributeError:
-            pass
+    for ((key, decode), val) in zip(cls._decode_ops, cls._unpack_from(octets)):
+        if decode is not None:
+            val = decode(val)
         args[key] = val
     return cls(args) ### octets[cls.struct.size:]
 
@@ -331,13 +370,20 @@ class Value(type):
         bases = tuple(obases)
         ### build the structured value fields from the class specification
         fields = OrderedDict(dct['spec'])
-        struct = Struct('>' + ''.join([_.sfmt for _ in fields.values() if _.sfmt]))
+        struct = _cached_struct('>' + ''.join([_.sfmt for _ in fields.values() if _.sfmt]))
         ### build the class body...
         ### ...from specified methods and attributes in `dct`
         body = dict(dct)
         ### ...overriding with StructuredValue methods and attributes
         body['fields'] = fields
+        ### ...binding the field methods used on every encode and decode, or None for fields which
+        ### have no such method (their values are packed and unpacked as is)
+        body['_encode_ops'] = tuple([(k, getattr(v, 'encode', None)) for (k, v) in fields.items()])
+        body['_decode_ops'] = tuple([(k, getattr(v, 'decode', None)) for (k, v) in fields.items()])
         body['struct'] = struct
+        ### ...binding the struct methods used on every encode and decode
+        body['_pack'] = struct.pack
+        body['_unpack_from'] = struct.unpack_from
         body['__init__'] = _value_init(bases, dct)
         body['__setitem__'] = _value_setitem
         body['screen'] = _value_screen
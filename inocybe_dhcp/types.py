@@ -16,18 +16,18 @@
 # See the Apache Version 2.0 License for specific language governing
 # permissions and limitations under the License.
 
-from collections import OrderedDict
+from binascii import hexlify, unhexlify
 
-from struct import unpack_from as s_unpack
-from struct import calcsize as s_size
-from struct import pack as s_pack
+from struct import Struct
 from socket import AF_INET, inet_ntop, inet_pton
 from socket import error as SocketError
 
-from six import (iteritems, binary_type, iterbytes, PY2, int2byte)
+from types import MappingProxyType
 
 class ValueType(object):
     '''A base class for value types.'''
+    ### a :class:`Struct` compiled from :attr:`sfmt`, for value types whose format is fixed
+    _struct = None
     @property
     def sfmt(self):
         '''Return a :module:`struct` format string (which MUST NOT be prefixed with a byte order
@@ -45,19 +45,25 @@ class ValueType(object):
         '''Return a binary string packing `val`. If :attr:`sfmt` is None then this method MUST be
            overridden. Raise :class:`ValueError` or :class:`TypeError` if `val` cannot be packed.
         '''
-        if self.sfmt is None:
-            raise NotImplementedError()
-        return s_pack('>' + self.sfmt, val)
+        return self._get_struct().pack(val)
     def unpack(self, octets):
         '''Return a 2-tuple (val, octets), the value unpacked from binary string `octets`, and the
            trailing octets not unpacked, respectively. If :attr:`sfmt` is None then this method MUST
            be overridden. Raise :class:`ValueError` or :class:`TypeError` if a value of this type
            cannot be unpacked from `octets`.
         '''
+        struct = self._get_struct()
+        return (struct.unpack_from(octets)[0], octets[struct.size:])
+    def _get_struct(self):
+        '''Return the :class:`Struct` for packing and unpacking values. If a :class:`Struct` was not
+           compiled in advance, then compile one from :attr:`sfmt`, which may vary between calls.
+           Raise :class:`NotImplementedError` if :attr:`sfmt` is None.
+        '''
+        if self._struct is not None:
+            return self._struct
         if self.sfmt is None:
             raise NotImplementedError()
-        sfmt = '>' + self.sfmt
-        return (s_unpack(sfmt, octets)[0], octets[s_size(sfmt):])
+        return Struct('>' + self.sfmt)
     @staticmethod
     def encode(val):
         '''Encode and return `val` for packing. Raise :class:`ValueError` or :class:`TypeError` if
@@ -80,6 +86,7 @@ class Int(ValueType):
         self._min = int(min_)
         self._max = int(max_)
         self._sfmt = sfmt
+        self._struct = Struct('>' + sfmt)
     @property
     def min_(self):
         '''Return the minimum value accepted by this type.'''
@@ -115,15 +122,24 @@ class Enum(Int):
     '''
     def __init__(self, min_, max_, sfmt, enum):
         Int.__init__(self, min_, max_, sfmt)
-        self.value_to_label = dict(enum)
-        self.label_to_value = dict([(v, k) for (k, v) in iteritems(self.value_to_label)])
+        value_to_label = dict(enum)
+        self.value_to_label = MappingProxyType(value_to_label)
+        self.label_to_value = MappingProxyType(
+            dict([(v, k) for (k, v) in value_to_label.items()])
+        )
     def __call__(self, val):
-        if val in self.label_to_value:
+        ### integer values need no lexical conversion, and are the most common input
+        if isinstance(val, int):
+            if val < self._min or self._max < val:
+                raise ValueError(val)
+            label = self.value_to_label.get(val)
+        elif val in self.label_to_value:
             return val
-        try:
-            return self.value_to_label[super(Enum, self).__call__(val)]
-        except KeyError:
+        else:
+            label = self.value_to_label.get(super(Enum, self).__call__(val))
+        if label is None:
             raise ValueError(val)
+        return label
     def encode(self, val):
         try:
             return self.label_to_value[val]
@@ -183,6 +199,7 @@ class IPv4(ValueType):
     '''A value type enforcing IPv4 address string values.
        Packed values are stored in a binary string of length four.
     '''
+    _struct = Struct('>4s')
     @property
     def sfmt(self):
         '''Return the :module:`struct` format string for packing and unpacking values.'''
@@ -222,6 +239,8 @@ class NulTerminatedString(ValueType):
         ValueType.__init__(self)
         self._max = int(max_)
         self._encoding = encoding
+        self._sfmt = '{:d}s'.format(self._max)
+        self._struct = Struct('>' + self._sfmt)
     @property
     def max_(self):
         '''Return the maximum encoded value length accepted by this type.'''
@@ -236,7 +255,7 @@ class NulTerminatedString(ValueType):
            encoded into a field of fixed size, :attr:`max_` octets. The 's' format automatically
            right fills with zeroes.
         '''
-        return '{:d}s'.format(self.max_)
+        return self._sfmt
     def __call__(self, val):
         '''Return `val` if it is a string whose encoded value complies with this type's max encoded
            length restriction. Otherwise, raise :class:`ValueError`.
@@ -248,11 +267,8 @@ class NulTerminatedString(ValueType):
            encoded value complies with this type's max encoded length restriction. Otherwise, raise
            :class:`ValueError`.
         '''
-        try:
+        if isinstance(val, str):
             octets = val.rstrip('\0').encode(self.encoding)
-        except AttributeError:
-            pass
-        else:
             if len(octets) < self.max_: ### allows at least 1 octet for NUL terminator
                 return octets
         raise ValueError(val)
@@ -261,20 +277,23 @@ class NulTerminatedString(ValueType):
            binary string value `octets`, with all characters after, and including, the first NUL
            terminator discarded. Otherwise, raise :class:`ValueError`.
         '''
+        ### split at the first NUL terminator before decoding, so that the length restriction is
+        ### checked on the binary string and the value need not be re-encoded to check it
         try:
-            val = octets.decode(self.encoding)
-        except AttributeError:
+            val = octets.partition(b'\0')[0]
+        except (AttributeError, TypeError):
             pass
         else:
-            idx = val.find('\0')
-            if idx != -1:
-                val = val[:idx]
-            try:
-                return self(val)
-            except ValueError:
-                pass
+            if len(val) < self.max_: ### allows at least 1 octet for NUL terminator
+                return val.decode(self.encoding)
         raise ValueError(octets)
 
+### the two character hexadecimal string for each octet value, indexed by octet value
+_HEX_OCTETS = tuple(['{:02x}'.format(_) for _ in range(256)])
+### binary string values at least this long are decoded with :func:`hexlify`, shorter ones by
+### indexing :data:`_HEX_OCTETS` (which is faster for short values)
+_HEX_HEXLIFY_MIN = 32
+
 class HexString(ValueType):
     '''A value type enforcing colon-separated hexadecimal string values which have a max encoded
        binary string length of `max_` octets.
@@ -282,6 +301,8 @@ class HexString(ValueType):
     def __init__(self, max_):
         ValueType.__init__(self)
         self._max = int(max_)
+        self._sfmt = '{:d}s'.format(self._max)
+        self._struct = Struct('>' + self._sfmt)
     @property
     def max_(self):
         '''Return the maximum encoded value length accepted by this type.'''
@@ -292,7 +313,7 @@ class HexString(ValueType):
            encoded into a field of fixed size, :attr:`max_` octets. The 's' format automatically
            right fills with zeroes.
         '''
-        return '{:d}s'.format(self.max_)
+        return self._sfmt
     def __call__(self, val):
         '''Return `val` if it is a hexadecimal string whose encoded value complies with this type's
            max encoded length restriction. Otherwise, raise :class:`ValueError`.
@@ -305,24 +326,41 @@ class HexString(ValueType):
            :class:`ValueError`.
         '''
         try:
-            elems = [] if val == '' else val.split(':')
+            count = val.count(':')
         except AttributeError:
-            pass
-        else:
-            if PY2:
-                octets = ''.join([int2byte(int(_, base=16)) for _ in elems])
-            else:
-                octets = bytes([int(_, base=16) for _ in elems]) ### pylint: disable=redefined-variable-type
-            if len(octets) <= self.max_:
-                return octets
+            raise ValueError(val)
+        octets = None
+        if len(val) == 3 * count + 2 and val[2::3] == ':' * count:
+            ### canonical 'xx:xx:...' strings are converted in a single C call; anything unhexlify
+            ### rejects is converted element by element below, which decides its validity
+            try:
+                octets = unhexlify(val.replace(':', ''))
+            except ValueError:
+                pass
+        if octets is None:
+            try:
+                elems = [] if val == '' else val.split(':')
+            except AttributeError:
+                raise ValueError(val)
+            octets = bytes([int(_, base=16) for _ in elems])
+        if len(octets) <= self.max_:
+            return octets
         raise ValueError(val)
     def decode(self, octets):
         '''Return a hexadecimal string value complying with this type's max encoded length
            restriction from binary string value `octets`. Otherwise, raise :class:`ValueError`.
         '''
-        ### note that Python 2 binary type is str, which this implementation will attempt to process
-        if isinstance(octets, binary_type) and len(octets) <= self.max_:
-            return ':'.join(['{:02x}'.format(_) for _ in iterbytes(octets)])
+        if isinstance(octets, bytes) and len(octets) <= self.max_:
+            num = len(octets)
+            if num < _HEX_HEXLIFY_MIN:
+                return ':'.join([_HEX_OCTETS[_] for _ in octets])
+            ### interleave the hexlified digit pairs with colons using extended slice assignment
+            digits = hexlify(octets)
+            chars = bytearray(3 * num - 1)
+            chars[0::3] = digits[0::2]
+            chars[1::3] = digits[1::2]
+            chars[2::3] = b':' * (num - 1)
+            return chars.decode('ascii')
         raise ValueError(octets)
     @staticmethod
     def truncate(val, max_):
@@ -364,10 +402,11 @@ def _structured_value_screen(self, key, val):
        If `val` is not a supported lexical value for field, raise :class:`ValueError`.
        Otherwise, return the canonical value for field from lexical value `val`.
     '''
-    try:
-        return self.fields[key](val)
-    except KeyError:
+    field = self.fields.get(key)
+    if field is None:
         raise KeyError('unsupported field for {}: {}'.format(self.name, key))
+    try:
+        return field(val)
     except ValueError:
         raise ValueError('bad value for {} field {}: {}'.format(self.name, key, val))
     except TypeError:
@@ -383,26 +422,97 @@ def _structured_value_update(self, *args, **kwargs):
         ivals[key] = self.screen(key, ivals[key])
     super(self.__class__, self).update(ivals)
 
-def _structured_value_pack(self):
-    '''A function for use as the pack method of a class built by :class:`StructuredValue`.
+def _structured_value_layout(spec):
+    '''Return the packed layout of a class built by :class:`StructuredValue` with `spec`, its
+       sequence of (key, field) pairs. The layout is a tuple of (struct, items) pairs in order of
+       occurrence in a packed binary string. Each run of consecutive fields with a
+       :attr:`ValueType.sfmt` is packed and unpacked together: struct is a :class:`Struct` compiled
+       for the run and items is a tuple of the run's (key, field) pairs. Each other field is packed
+       and unpacked by the field itself: struct is None and items is a tuple of the field's
+       solitary (key, field) pair.
+    '''
+    layout = []
+    run = []
+    for item in spec:
+        if item[1].sfmt is None:
+            if run:
+                layout.append((Struct('>' + ''.join([_[1].sfmt for _ in run])), tuple(run)))
+                run = []
+            layout.append((None, (item,)))
+        else:
+            run.append(item)
+    if run:
+        layout.append((Struct('>' + ''.join([_[1].sfmt for _ in run])), tuple(run)))
+    return tuple(layout)
+
+def _structured_value_methods(name, layout):
+    '''Return a 2-tuple (pack, unpack) of functions for use as the pack method and the unpack
+       classmethod, respectively, of class `name` built by :class:`StructuredValue` with `layout`,
+       as returned by :func:`_structured_value_layout`.
 
-       Raise :class:`KeyError` if any required field does not have a value in `self`.
+       The functions are generated from source specialised for `layout`: each field key, struct and
+       value type method is bound once per class, rather than looked up for each field on every
+       call, and calls to the default (identity) :meth:`ValueType.encode` and
+       :meth:`ValueType.decode` are omitted.
     '''
-    octets = b''
-    for key in self.fields:
-        field = self.fields[key]
-        val = field.encode(self[key])
-        octets += field.pack(val)
-    return octets
+    namespace = {}
+    chunks = []
+    statements = []
+    args = []
+    ### the static offset into `octets` of the next run of fields to unpack; `octets` is only
+    ### resliced ahead of a field which unpacks itself
+    offset = 0
+    for (idx, (struct, items)) in enumerate(layout):
+        vals = []
+        for (key, field) in items:
+            num = len(args)
+            val = 'self[{!r}]'.format(key)
+            if getattr(type(field), 'encode', None) is not ValueType.encode:
+                namespace['_e{:d}'.format(num)] = field.encode
+                val = '_e{:d}({})'.format(num, val)
+            vals.append(val)
+            arg = '_v{:d}'.format(num)
+            if getattr(type(field), 'decode', None) is not ValueType.decode:
+                namespace['_d{:d}'.format(num)] = field.decode
+                arg = '_d{:d}({})'.format(num, arg)
+            args.append('{!r}: {}'.format(key, arg))
+        if struct is None:
+            namespace['_p{:d}'.format(idx)] = items[0][1].pack
+            namespace['_u{:d}'.format(idx)] = items[0][1].unpack
+            chunks.append('_p{:d}({})'.format(idx, vals[0]))
+            if offset:
+                statements.append('octets = octets[{:d}:]'.format(offset))
+                offset = 0
+            statements.append('(_v{:d}, octets) = _u{:d}(octets)'.format(len(args) - 1, idx))
+        else:
+            namespace['_s{:d}'.format(idx)] = struct
+            chunks.append('_s{:d}.pack({})'.format(idx, ', '.join(vals)))
+            statements.append('({},) = _s{:d}.unpack_from(octets, {:d})'.format(
+                ', '.join(['_v{:d}'.format(_) for _ in range(len(args) - len(items), len(args))]),
+                idx,
+                offset,
+            ))
+            offset += struct.size
+    if len(chunks) == 1:
+        packed = chunks[0]
+    else:
+        packed = "b''.join(({}))".format(''.join([_ + ', ' for _ in chunks]))
+    source = '\n'.join([
+        'def pack(self):',
+        '    return {}'.format(packed),
+        'def unpack(cls, octets):',
+    ] + ['    ' + _ for _ in statements] + [
+        '    return cls({{{}}})'.format(', '.join(args)),
+    ])
+    exec(compile(source, '<{} methods>'.format(name), 'exec'), namespace) ### pylint: disable=exec-used
+    namespace['pack'].__doc__ = (
+        '''Return a binary string packing `self`.
 
-def _structured_value_unpack(cls, octets):
-    '''A function for use as the unpack classmethod of a class built by :class:`StructuredValue`.'''
-    args = {}
-    for key in cls.fields:
-        field = cls.fields[key]
-        (val, octets) = field.unpack(octets)
-        args[key] = field.decode(val)
-    return cls(args)
+           Raise :class:`KeyError` if any required field does not have a value in `self`.
+        '''
+    )
+    namespace['unpack'].__doc__ = '''Return an instance unpacked from binary string `octets`.'''
+    return (namespace['pack'], namespace['unpack'])
 
 class StructuredValue(type):
     '''A metaclass for constructing classes which represent a structured value. A structured value
@@ -427,11 +537,15 @@ class StructuredValue(type):
         obases.insert(0, dict)
         bases = tuple(obases)
         body = dict(dct)
-        body['fields'] = OrderedDict(dct['spec'])
+        ### fields are iterated in order from `_spec`, so `fields` is only needed for key lookups
+        body['_spec'] = tuple([tuple(_) for _ in dct['spec']])
+        body['fields'] = MappingProxyType(dict(body['_spec']))
+        body['_layout'] = _structured_value_layout(body['_spec'])
         body['__init__'] = _structured_value_init(bases, dct)
         body['__setitem__'] = _structured_value_setitem
         body['screen'] = _structured_value_screen
         body['update'] = _structured_value_update
-        body['pack'] = _structured_value_pack
-        body['unpack'] = classmethod(_structured_value_unpack)
+        (pack, unpack) = _structured_value_methods(name, body['_layout'])
+        body['pack'] = pack
+        body['unpack'] = classmethod(unpack)
         return type(name, bases, body)